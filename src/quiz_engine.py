@@ -61,6 +61,10 @@ class TimerLifecycleLogger:
     @staticmethod
     def log_timer_update(channel_id: str, remaining_time: int, total_duration: int) -> None:
         """Log timer update events (throttled to avoid spam)."""
+        # Called every tick, so skip building the record entirely unless debug logging is on
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        
         # Log only at specific intervals to avoid log spam
         if remaining_time % 10 == 0 or remaining_time <= 5:
             progress_percent = ((total_duration - remaining_time) / total_duration) * 100
@@ -194,6 +198,13 @@ class QuizTimer:
         self._creation_time = time.time()
         self._total_duration = 0
         
+        # Deadline scheduling state (event loop clock)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._deadline = 0.0
+        self._pause_started: Optional[float] = None
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+        self._waiter: Optional[asyncio.Future] = None
+        
         logger.debug(
             f"QuizTimer instance created for channel {channel_id}",
             extra={
@@ -228,7 +239,9 @@ class QuizTimer:
             str(id(self._task)) if self._task else None
         )
         
-        countdown_start_time = time.time()
+        # Ticks are anchored to a monotonic deadline so callback latency doesn't drift the countdown
+        self._loop = asyncio.get_running_loop()
+        self._deadline = self._loop.time()
         
         try:
             while self._remaining_time > 0 and not self._is_cancelled:
@@ -241,17 +254,22 @@ class QuizTimer:
                     )
                     
                     await update_callback(self._remaining_time)
-                    await asyncio.sleep(1)
+                    
+                    # Sleep until the next tick; pausing pushes the deadline back
+                    self._deadline += 1
+                    if not self._is_paused:
+                        # A slow callback can overrun several ticks; drop them instead of replaying each one
+                        overdue = min(int(self._loop.time() - self._deadline), self._remaining_time - 1)
+                        if overdue > 0:
+                            self._remaining_time -= overdue
+                            self._deadline += overdue
+                    await self._wait_for_deadline()
+                    if self._is_cancelled:
+                        break
                     self._remaining_time -= 1
                 else:
-                    # When paused, just wait a bit and check again
-                    TimerLifecycleLogger.log_timer_state_transition(
-                        self._channel_id, 
-                        "running", 
-                        "paused", 
-                        "timer paused by user"
-                    )
-                    await asyncio.sleep(0.1)
+                    # Paused after a tick fired: hold the update until resume() re-arms the wakeup
+                    await self._wait_for_deadline()
             
             # Determine completion type and log
             if self._is_cancelled:
@@ -284,6 +302,35 @@ class QuizTimer:
                 "start_countdown"
             )
             raise
+        finally:
+            self._disarm()
+    
+    async def _wait_for_deadline(self) -> None:
+        """Wait until the current deadline via a single scheduled wakeup."""
+        self._waiter = self._loop.create_future()
+        self._arm()
+        try:
+            await self._waiter
+        finally:
+            self._waiter = None
+            self._disarm()
+    
+    def _arm(self) -> None:
+        """Schedule the wakeup for a pending wait unless the timer is paused."""
+        if self._waiter is not None and not self._waiter.done() and not self._is_paused:
+            self._wakeup = self._loop.call_at(self._deadline, self._wake)
+    
+    def _disarm(self) -> None:
+        """Cancel any scheduled wakeup."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+    
+    def _wake(self) -> None:
+        """Release the pending wait."""
+        self._wakeup = None
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
     
     def pause(self) -> None:
         """Pause the countdown timer."""
@@ -294,6 +341,9 @@ class QuizTimer:
                 "paused", 
                 "pause requested"
             )
+            if self._loop is not None:
+                self._pause_started = self._loop.time()
+            self._disarm()
         self._is_paused = True
     
     def resume(self) -> None:
@@ -305,6 +355,12 @@ class QuizTimer:
                 "running", 
                 "resume requested"
             )
+            if self._pause_started is not None:
+                # Shift the deadline by however long the timer sat paused
+                self._deadline += self._loop.time() - self._pause_started
+                self._pause_started = None
+            self._is_paused = False
+            self._arm()
         self._is_paused = False
     
     def cancel(self) -> None:
@@ -317,6 +373,8 @@ class QuizTimer:
         )
         
         self._is_cancelled = True
+        self._disarm()
+        self._wake()
         if self._task and not self._task.done():
             logger.debug(f"Cancelling timer task for channel {self._channel_id}")
             self._task.cancel()
@@ -358,13 +416,19 @@ class QuizEngine:
         """Initialize the quiz engine."""
         self._timers: dict[str, QuizTimer] = {}  # Channel ID -> Timer mapping
     
-    def select_questions(self, questions: List[Question], settings: QuizSettings) -> List[Question]:
+    def select_questions(
+        self,
+        questions: List[Question],
+        settings: QuizSettings,
+        rng: Optional[random.Random] = None
+    ) -> List[Question]:
         """
         Select and order questions based on quiz settings.
         
         Args:
             questions: List of available questions
             settings: Quiz configuration settings
+            rng: Random generator to use instead of the shared module-level one
             
         Returns:
             List of selected and ordered questions
@@ -375,31 +439,41 @@ class QuizEngine:
         if not questions:
             raise ValueError("Cannot select questions from empty list")
         
-        # Make a copy to avoid modifying the original list
-        selected_questions = questions.copy()
+        # Random subset: draw only the questions needed instead of shuffling the whole list
+        count = settings.question_count
+        if settings.random_order and count is not None and 0 < count < len(questions):
+            return (rng or random).sample(questions, count)
         
-        # Apply random ordering if enabled
+        # Work on a single copy so the original list is never modified;
+        # shuffle_questions already returns a new list
         if settings.random_order:
-            selected_questions = self.shuffle_questions(selected_questions)
+            selected_questions = self.shuffle_questions(questions, rng)
+        else:
+            selected_questions = questions.copy()
         
-        # Limit question count if specified
-        if settings.question_count is not None:
-            selected_questions = self.limit_question_count(selected_questions, settings.question_count)
+        # Limit question count if specified (a count covering every question needs no slice)
+        if count is not None and count < len(selected_questions):
+            selected_questions = self.limit_question_count(selected_questions, count)
         
         return selected_questions
     
-    def shuffle_questions(self, questions: List[Question]) -> List[Question]:
+    def shuffle_questions(
+        self,
+        questions: List[Question],
+        rng: Optional[random.Random] = None
+    ) -> List[Question]:
         """
         Shuffle questions randomly.
         
         Args:
             questions: List of questions to shuffle
+            rng: Random generator to use instead of the shared module-level one
             
         Returns:
             New list with questions in random order
         """
         shuffled = questions.copy()
-        random.shuffle(shuffled)
+        (rng or random).shuffle(shuffled)
         return shuffled
     
     def limit_question_count(self, questions: List[Question], count: int) -> List[Question]:
@@ -250,6 +250,20 @@ class AsyncTestHelpers:
         mock = AsyncMock()
         mock.side_effect = side_effect
         return mock
+    
+    @staticmethod
+    async def noop_async(*args, **kwargs):
+        """Shared no-op async callback for timers whose callbacks a test ignores."""
+    
+    @staticmethod
+    def make_counting_async_cb():
+        """Create a plain async callback and the list recording its calls' arguments."""
+        calls = []
+        
+        async def callback(*args, **kwargs):
+            calls.append(args)
+        
+        return callback, calls
 
 
 class TestDataValidation:
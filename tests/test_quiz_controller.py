@@ -1,29 +1,110 @@
 """
 Unit tests for QuizController session state management.
 """
+import asyncio
+import gc
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from contextlib import contextmanager, ExitStack
+from unittest.mock import Mock
 from datetime import datetime, timedelta
-from typing import List
-import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
 
 from src.quiz_controller import QuizController, SessionState
-from src.models import Question, QuizSettings, QuizSession
+from src.models import Question, QuizSettings
 from src.data_manager import DataManager
 from src.config_manager import ConfigManager
 from tests.test_fixtures import TestFixtures, TestDataValidation
 
 
+# Age used to simulate a stale session
+_TWO_HOURS = timedelta(hours=2)
+
+# Keys every quiz completion summary must carry
+_REQUIRED_COMPLETION_KEYS = frozenset({'quiz_name', 'total_questions', 'duration', 'settings'})
+
+# Channel IDs shared by the multi-session tests
+_CONCURRENT_IDS = (12345, 12346, 12347, 12348, 12349)
+_BULK_IDS = tuple(range(20000, 20010))
+
+# Session operations driven by the state transition matrix
+_OPS = {
+    "create": QuizController.create_session,
+    "pause": QuizController.pause_session,
+    "resume": QuizController.resume_session,
+    "stop": QuizController.stop_session,
+}
+_OP_ARGS = {"create": ("test_quiz",)}
+
+# (initial state, operation, expected state)
+_TRANSITIONS = (
+    (SessionState.INACTIVE, "create", SessionState.ACTIVE),
+    (SessionState.ACTIVE, "pause", SessionState.PAUSED),
+    (SessionState.PAUSED, "resume", SessionState.ACTIVE),
+    (SessionState.ACTIVE, "stop", SessionState.INACTIVE),
+)
+
+# Operations that move a session from its current state to the state a transition expects
+_REACH = {
+    (SessionState.INACTIVE, SessionState.ACTIVE): ("create",),
+    (SessionState.ACTIVE, SessionState.PAUSED): ("pause",),
+}
+
+
+def _run_op(controller, op_name, channel_id):
+    """Apply a named session operation to the controller."""
+    result = _OPS[op_name](controller, channel_id, *_OP_ARGS.get(op_name, ()))
+    # stop_session is a coroutine; run it to completion so the operation really happens
+    if asyncio.iscoroutine(result):
+        result = asyncio.run(result)
+    return result
+
+
+def _session_worker(controller, channel_id, quiz_name="test_quiz"):
+    """Run a full create/pause/resume/stop cycle and return each step's result."""
+    create_result = controller.create_session(channel_id, quiz_name)
+    pause_result = controller.pause_session(channel_id)
+    resume_result = controller.resume_session(channel_id)
+    stop_result = asyncio.run(controller.stop_session(channel_id))
+    return (channel_id, create_result, pause_result, resume_result, stop_result)
+
+
+class _StubDataManager:
+    """Minimal DataManager stand-in that records quiz lookups."""
+    
+    __slots__ = ("questions", "available", "quiz_questions_calls")
+    
+    def __init__(self, questions, available=()):
+        self.questions = questions
+        self.available = available
+        self.quiz_questions_calls = []
+    
+    def get_quiz_questions(self, quiz_name):
+        self.quiz_questions_calls.append(quiz_name)
+        if isinstance(self.questions, Exception):
+            raise self.questions
+        return self.questions
+    
+    def get_available_quizzes(self):
+        return list(self.available)
+
+
+class _StubConfigManager:
+    """Minimal ConfigManager stand-in returning fixed quiz settings."""
+    
+    __slots__ = ("settings",)
+    
+    def __init__(self, settings):
+        self.settings = settings
+    
+    def get_quiz_settings(self):
+        return self.settings
+
+
 class TestQuizControllerSessionState(unittest.TestCase):
     """Test cases for QuizController session state management."""
     
     def setUp(self):
         """Set up test fixtures."""
-        # Create mock dependencies
-        self.mock_data_manager = Mock(spec=DataManager)
-        self.mock_config_manager = Mock(spec=ConfigManager)
-        
         # Create sample questions
         self.sample_questions = [
             Question("What is 2+2?", "4"),
@@ -38,12 +119,12 @@ class TestQuizControllerSessionState(unittest.TestCase):
             timer_duration=10
         )
         
-        # Set up mock returns
-        self.mock_data_manager.get_quiz_questions.return_value = self.sample_questions
-        self.mock_config_manager.get_quiz_settings.return_value = self.sample_settings
+        # Create stub dependencies
+        self.data_manager = _StubDataManager(self.sample_questions)
+        self.config_manager = _StubConfigManager(self.sample_settings)
         
         # Create controller instance
-        self.controller = QuizController(self.mock_data_manager, self.mock_config_manager)
+        self.controller = QuizController(self.data_manager, self.config_manager)
     
     def test_create_session_success(self):
         """Test successful session creation."""
@@ -54,7 +135,7 @@ class TestQuizControllerSessionState(unittest.TestCase):
         
         self.assertTrue(result)
         self.assertTrue(self.controller.has_active_session(channel_id))
-        self.mock_data_manager.get_quiz_questions.assert_called_once_with(quiz_name)
+        self.assertEqual(self.data_manager.quiz_questions_calls, [quiz_name])
     
     def test_create_session_with_custom_settings(self):
         """Test session creation with custom settings."""
@@ -89,8 +170,8 @@ class TestQuizControllerSessionState(unittest.TestCase):
         channel_id = 12345
         quiz_name = "empty_quiz"
         
-        # Mock empty questions list
-        self.mock_data_manager.get_quiz_questions.return_value = []
+        # Stub empty questions list
+        self.data_manager.questions = []
         
         result = self.controller.create_session(channel_id, quiz_name)
         
@@ -102,8 +183,8 @@ class TestQuizControllerSessionState(unittest.TestCase):
         channel_id = 12345
         quiz_name = "nonexistent_quiz"
         
-        # Mock exception from data manager
-        self.mock_data_manager.get_quiz_questions.side_effect = ValueError("Quiz not found")
+        # Stub exception from data manager
+        self.data_manager.questions = ValueError("Quiz not found")
         
         result = self.controller.create_session(channel_id, quiz_name)
         
@@ -347,10 +428,6 @@ class TestQuizControllerSessionControl(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        # Create mock dependencies
-        self.mock_data_manager = Mock(spec=DataManager)
-        self.mock_config_manager = Mock(spec=ConfigManager)
-        
         # Create sample questions
         self.sample_questions = [
             Question("What is 2+2?", "4"),
@@ -365,13 +442,14 @@ class TestQuizControllerSessionControl(unittest.TestCase):
             timer_duration=10
         )
         
-        # Set up mock returns
-        self.mock_data_manager.get_quiz_questions.return_value = self.sample_questions
-        self.mock_data_manager.get_available_quizzes.return_value = ["test_quiz", "another_quiz"]
-        self.mock_config_manager.get_quiz_settings.return_value = self.sample_settings
+        # Create stub dependencies
+        self.data_manager = _StubDataManager(
+            self.sample_questions, available=("test_quiz", "another_quiz")
+        )
+        self.config_manager = _StubConfigManager(self.sample_settings)
         
         # Create controller instance
-        self.controller = QuizController(self.mock_data_manager, self.mock_config_manager)
+        self.controller = QuizController(self.data_manager, self.config_manager)
     
     def test_start_quiz_success(self):
         """Test successfully starting a quiz."""
@@ -428,8 +506,8 @@ class TestQuizControllerSessionControl(unittest.TestCase):
         channel_id = 12345
         quiz_name = "test_quiz"
         
-        # Mock creation failure
-        self.mock_data_manager.get_quiz_questions.return_value = []
+        # Stub creation failure
+        self.data_manager.questions = []
         
         result = self.controller.start_quiz(channel_id, quiz_name)
         
@@ -753,129 +831,142 @@ class TestQuizControllerSessionControl(unittest.TestCase):
 class TestQuizControllerComprehensive(unittest.TestCase):
     """Comprehensive tests for QuizController functionality."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the spec'd collaborator mocks once for the whole class."""
+        cls._dm_proto = Mock(spec=DataManager)
+        cls._cm_proto = Mock(spec=ConfigManager)
+        
+        # Fixture data is read-only in these tests, so share one copy
+        cls._QUESTIONS = TestFixtures.create_sample_questions()
+        cls._SETTINGS = TestFixtures.create_sample_quiz_settings()
+        cls._N = min(cls._SETTINGS.question_count, len(cls._QUESTIONS))
+        
+        # Stateless controller standing in for a restarted process; only queried, never mutated
+        cls._fresh_controller = QuizController(cls._dm_proto, cls._cm_proto)
+        
+        # Persistent worker pool for the concurrency tests
+        cls._pool = ThreadPoolExecutor(max_workers=8)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Shut down the shared worker pool."""
+        cls._pool.shutdown()
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.mock_data_manager = Mock(spec=DataManager)
-        self.mock_config_manager = Mock(spec=ConfigManager)
-        
-        self.sample_questions = TestFixtures.create_sample_questions()
-        self.sample_settings = TestFixtures.create_sample_quiz_settings()
-        
-        self.mock_data_manager.get_quiz_questions.return_value = self.sample_questions
-        self.mock_config_manager.get_quiz_settings.return_value = self.sample_settings
+        # Reuse the class-level mocks; resetting is much cheaper than re-introspecting the spec
+        self.mock_data_manager = self._dm_proto
+        self.mock_data_manager.reset_mock(return_value=True, side_effect=True)
+        self.mock_config_manager = self._cm_proto
+        self.mock_config_manager.reset_mock(return_value=True, side_effect=True)
+        
+        self.sample_questions = self._QUESTIONS
+        self.sample_settings = self._SETTINGS
+        
+        # Before Python 3.9 the parent reset leaves children's return_value and side_effect alone,
+        # so the configured children are set in full here
+        self.mock_data_manager.configure_mock(**{
+            'get_quiz_questions.return_value': self.sample_questions,
+            'get_quiz_questions.side_effect': None,
+        })
+        self.mock_config_manager.configure_mock(**{
+            'get_quiz_settings.return_value': self.sample_settings,
+            'get_quiz_settings.side_effect': None,
+        })
         
         self.controller = QuizController(self.mock_data_manager, self.mock_config_manager)
     
+    @contextmanager
+    def _session(self, channel_id, quiz_name="test_quiz"):
+        """Create a session for the block and always stop it afterwards."""
+        self.assertTrue(self.controller.create_session(channel_id, quiz_name))
+        try:
+            yield self.controller.get_session(channel_id)
+        finally:
+            # stop_session is a coroutine; run it to completion so the session is really removed
+            asyncio.run(self.controller.stop_session(channel_id))
+    
+    @contextmanager
+    def _sessions(self, channel_ids, quiz_name="test_quiz"):
+        """Create sessions for several channels and stop all of them on exit."""
+        with ExitStack() as stack:
+            yield [stack.enter_context(self._session(channel_id, quiz_name)) for channel_id in channel_ids]
+    
     def test_session_timeout_handling(self):
         """Test handling of session timeouts."""
         channel_id = 12345
-        quiz_name = "test_quiz"
-        
-        # Create session
-        self.controller.create_session(channel_id, quiz_name)
-        session = self.controller.get_session(channel_id)
-        
-        # Simulate old session by modifying start time
-        session.start_time = datetime.now() - timedelta(hours=2)
         
-        # Check if session is considered expired
-        validation = self.controller.validate_session_state(channel_id)
-        
-        # Should detect timeout issues
-        self.assertIn('session_info', validation)
+        with self._session(channel_id) as session:
+            # Simulate old session by modifying start time
+            session.start_time = datetime.now() - _TWO_HOURS
+            
+            # Check if session is considered expired
+            validation = self.controller.validate_session_state(channel_id)
+            
+            # Should detect timeout issues
+            self.assertIn('session_info', validation)
     
     def test_concurrent_session_operations(self):
         """Test thread safety of session operations."""
-        channel_ids = [12345, 12346, 12347, 12348, 12349]
-        quiz_name = "test_quiz"
+        channel_ids = _CONCURRENT_IDS
         
-        results = []
-        errors = []
+        # Run the workers on the shared pool
+        futures = [
+            self._pool.submit(_session_worker, self.controller, channel_id)
+            for channel_id in channel_ids
+        ]
         
-        def session_worker(channel_id):
-            try:
-                # Create session
-                create_result = self.controller.create_session(channel_id, quiz_name)
-                
-                # Perform operations
-                pause_result = self.controller.pause_session(channel_id)
-                resume_result = self.controller.resume_session(channel_id)
-                stop_result = self.controller.stop_session(channel_id)
-                
-                results.append({
-                    'channel_id': channel_id,
-                    'create': create_result,
-                    'pause': pause_result,
-                    'resume': resume_result,
-                    'stop': stop_result
-                })
-            except Exception as e:
-                errors.append((channel_id, e))
-        
-        # Start multiple threads
-        threads = []
-        for channel_id in channel_ids:
-            thread = threading.Thread(target=session_worker, args=(channel_id,))
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for completion
-        for thread in threads:
-            thread.join(timeout=10)
-        
-        # Verify no errors and all operations completed
-        self.assertEqual(len(errors), 0)
-        self.assertEqual(len(results), len(channel_ids))
+        # Collect outcomes on the main thread; a worker exception is re-raised
+        # here with its original traceback
+        results = [future.result(timeout=10) for future in futures]
+        
+        # Verify every worker ran its full cycle
+        self.assertEqual(sorted(result[0] for result in results), sorted(channel_ids))
+        self.assertTrue(all(create for _, create, *_ in results), results)
+        self.assertTrue(all(stop for *_, stop in results), results)
         
         # Verify all sessions were properly cleaned up
-        for channel_id in channel_ids:
-            self.assertFalse(self.controller.has_active_session(channel_id))
+        self.assertEqual(set(self.controller.get_all_active_sessions()) & set(channel_ids), set())
     
     def test_session_data_integrity(self):
         """Test session data integrity during operations."""
         channel_id = 12345
-        quiz_name = "test_quiz"
         
-        # Create session
-        self.controller.create_session(channel_id, quiz_name)
-        original_session = self.controller.get_session(channel_id)
-        
-        # Verify initial integrity
-        self.assertTrue(TestDataValidation.validate_quiz_session(original_session))
-        
-        # Perform operations and verify integrity is maintained
-        operations = [
-            lambda: self.controller.pause_session(channel_id),
-            lambda: self.controller.resume_session(channel_id),
-            lambda: self.controller.get_next_question(channel_id),
-            lambda: self.controller.get_next_question(channel_id),
-        ]
-        
-        for operation in operations:
-            operation()
-            session = self.controller.get_session(channel_id)
-            if session:  # Session might be None after completion
+        with self._session(channel_id) as session:
+            # Verify initial integrity
+            self.assertTrue(TestDataValidation.validate_quiz_session(session))
+            
+            # Perform operations and verify integrity is maintained
+            operations = [
+                lambda: self.controller.pause_session(channel_id),
+                lambda: self.controller.resume_session(channel_id),
+                lambda: self.controller.get_next_question(channel_id),
+                lambda: self.controller.get_next_question(channel_id),
+            ]
+            
+            # Re-fetch after each operation so the check covers what the controller stores;
+            # two questions into a three-question quiz, the session must still exist
+            for operation in operations:
+                operation()
+                session = self.controller.get_session(channel_id)
+                self.assertIsNotNone(session)
                 self.assertTrue(TestDataValidation.validate_quiz_session(session))
     
     def test_memory_cleanup_after_sessions(self):
         """Test memory cleanup after session completion."""
-        import gc
-        import sys
+        get_next = self.controller.get_next_question
+        is_done = self.controller.is_quiz_complete
         
         # Create and complete multiple sessions
-        for i in range(100):
+        for i in range(10):
             channel_id = 10000 + i
-            quiz_name = "test_quiz"
-            
-            # Create session
-            self.controller.create_session(channel_id, quiz_name)
-            
-            # Complete quiz
-            while not self.controller.is_quiz_complete(channel_id):
-                self.controller.get_next_question(channel_id)
             
-            # Stop session
-            self.controller.stop_session(channel_id)
+            # Complete quiz; the session is stopped on leaving the block
+            with self._session(channel_id):
+                for _ in range(self._N):
+                    get_next(channel_id)
+                self.assertTrue(is_done(channel_id))
         
         # Force garbage collection
         gc.collect()
@@ -887,34 +978,20 @@ class TestQuizControllerComprehensive(unittest.TestCase):
     def test_session_state_transitions(self):
         """Test all possible session state transitions."""
         channel_id = 12345
-        quiz_name = "test_quiz"
-        
-        # Test state transition matrix
-        transitions = [
-            (SessionState.INACTIVE, lambda: self.controller.create_session(channel_id, quiz_name), SessionState.ACTIVE),
-            (SessionState.ACTIVE, lambda: self.controller.pause_session(channel_id), SessionState.PAUSED),
-            (SessionState.PAUSED, lambda: self.controller.resume_session(channel_id), SessionState.ACTIVE),
-            (SessionState.ACTIVE, lambda: self.controller.stop_session(channel_id), SessionState.INACTIVE),
-        ]
         
-        for initial_state, operation, expected_state in transitions:
-            # Verify initial state
-            current_state = self.controller.get_session_state(channel_id)
-            if current_state != initial_state:
+        for initial_state, op_name, expected_state in _TRANSITIONS:
+            with self.subTest(initial=initial_state.name, op=op_name, expected=expected_state.name):
                 # Set up the required initial state
-                if initial_state == SessionState.ACTIVE and current_state == SessionState.INACTIVE:
-                    self.controller.create_session(channel_id, quiz_name)
-                elif initial_state == SessionState.PAUSED and current_state == SessionState.ACTIVE:
-                    self.controller.pause_session(channel_id)
-                elif initial_state == SessionState.INACTIVE and current_state != SessionState.INACTIVE:
-                    self.controller.stop_session(channel_id)
-            
-            # Perform operation
-            operation()
-            
-            # Verify expected state
-            final_state = self.controller.get_session_state(channel_id)
-            self.assertEqual(final_state, expected_state)
+                current_state = self.controller.get_session_state(channel_id)
+                for setup_op in _REACH.get((current_state, initial_state), ()):
+                    _run_op(self.controller, setup_op, channel_id)
+                
+                # Perform operation
+                _run_op(self.controller, op_name, channel_id)
+                
+                # Verify expected state
+                final_state = self.controller.get_session_state(channel_id)
+                self.assertEqual(final_state, expected_state)
     
     def test_error_recovery_mechanisms(self):
         """Test error recovery mechanisms."""
@@ -941,57 +1018,44 @@ class TestQuizControllerComprehensive(unittest.TestCase):
         quiz_name = "test_quiz"
         
         # Create and run session
-        start_time = datetime.now()
         self.controller.create_session(channel_id, quiz_name)
         
-        # Get some questions
-        question_count = 0
-        while not self.controller.is_quiz_complete(channel_id) and question_count < 2:
-            self.controller.get_next_question(channel_id)
-            question_count += 1
+        # Walk every selected question so the quiz completes
+        get_next = self.controller.get_next_question
+        for _ in range(self._N):
+            get_next(channel_id)
         
         # Get completion info
         completion_info = self.controller.get_quiz_completion_info(channel_id)
+        self.assertIsNotNone(completion_info)
+        self.assertTrue(_REQUIRED_COMPLETION_KEYS <= completion_info.keys(), completion_info.keys())
         
-        if completion_info:  # If quiz completed
-            self.assertIn('quiz_name', completion_info)
-            self.assertIn('total_questions', completion_info)
-            self.assertIn('duration', completion_info)
-            self.assertIn('settings', completion_info)
-            
-            # Verify duration is reasonable
-            duration = completion_info['duration']
-            self.assertGreater(duration, 0)
-            self.assertLess(duration, 60)  # Should complete within 60 seconds
+        # Verify duration is reasonable (should complete within 60 seconds)
+        duration = completion_info['duration']['total_seconds']
+        self.assertTrue(0 <= duration < 60, duration)
     
     def test_bulk_session_operations(self):
         """Test bulk operations on multiple sessions."""
-        # Create multiple sessions
-        channel_ids = list(range(20000, 20010))
-        quiz_name = "test_quiz"
+        channel_ids = _BULK_IDS
         
-        for channel_id in channel_ids:
-            result = self.controller.create_session(channel_id, quiz_name)
-            self.assertTrue(result)
-        
-        # Verify all sessions are active
-        active_sessions = self.controller.get_all_active_sessions()
-        self.assertEqual(len(active_sessions), len(channel_ids))
-        
-        # Pause all sessions
-        for channel_id in channel_ids:
-            self.controller.pause_session(channel_id)
-        
-        # Verify all are paused
-        for channel_id in channel_ids:
-            self.assertEqual(self.controller.get_session_state(channel_id), SessionState.PAUSED)
-        
-        # Cleanup all sessions
-        cleaned = self.controller.cleanup_inactive_sessions()
-        
-        # Stop remaining sessions
-        for channel_id in channel_ids:
-            self.controller.stop_session(channel_id)
+        # Create multiple sessions; all of them are stopped on leaving the block
+        with self._sessions(channel_ids):
+            # Verify all sessions are active
+            active_sessions = self.controller.get_all_active_sessions()
+            self.assertEqual(len(active_sessions), len(channel_ids))
+            
+            # Pause all sessions
+            pause = self.controller.pause_session
+            for channel_id in channel_ids:
+                pause(channel_id)
+            
+            # Verify all are paused
+            get_state = self.controller.get_session_state
+            states = {channel_id: get_state(channel_id) for channel_id in channel_ids}
+            self.assertEqual(set(states.values()), {SessionState.PAUSED}, states)
+            
+            # Cleanup all sessions
+            cleaned = self.controller.cleanup_inactive_sessions()
         
         # Verify cleanup
         final_active = self.controller.get_all_active_sessions()
@@ -1004,14 +1068,13 @@ class TestQuizControllerComprehensive(unittest.TestCase):
         
         # Create session and get some questions
         self.controller.create_session(channel_id, quiz_name)
-        original_session = self.controller.get_session(channel_id)
         
         # Get first question
         first_question = self.controller.get_next_question(channel_id)
         self.assertIsNotNone(first_question)
         
-        # Simulate restart by creating new controller
-        new_controller = QuizController(self.mock_data_manager, self.mock_config_manager)
+        # Simulate restart with a controller that has never seen this session
+        new_controller = self._fresh_controller
         
         # Session should not exist in new controller (no persistence)
         self.assertFalse(new_controller.has_active_session(channel_id))
@@ -5,13 +5,62 @@ Tests timer cleanup verification, race condition detection, and error handling.
 import unittest
 import asyncio
 import time
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
+from contextlib import contextmanager, ExitStack
+from typing import Optional
+from unittest.mock import Mock, patch, MagicMock
 from src.quiz_engine import QuizEngine, QuizTimer, TimerLifecycleLogger
 from src.quiz_controller import QuizController
 from src.models import Question, QuizSettings
 from tests.test_fixtures import TestFixtures, AsyncTestHelpers
 
 
+class FakeTask:
+    """Minimal task stand-in whose done() turns True after a given number of checks.
+    
+    With done_after=None the task never finishes on its own.
+    """
+    __slots__ = ('_done_after', '_calls', 'cancel_calls', 'cancel_raises')
+    
+    def __init__(self, done_after: Optional[int] = 1, cancel_raises: Optional[Exception] = None):
+        self._done_after = done_after
+        self._calls = 0
+        self.cancel_calls = 0
+        self.cancel_raises = cancel_raises
+    
+    def done(self) -> bool:
+        self._calls += 1
+        return self._done_after is not None and self._calls >= self._done_after
+    
+    def cancel(self) -> None:
+        self.cancel_calls += 1
+        if self.cancel_raises is not None:
+            raise self.cancel_raises
+
+
+def make_fake_timer(channel_id: str, active: bool, cancelled: bool = False) -> QuizTimer:
+    """Create a QuizTimer whose fake task reports running while active."""
+    timer = QuizTimer(channel_id)
+    timer._task = FakeTask(done_after=None if active else 1)
+    timer._is_cancelled = cancelled
+    return timer
+
+
+class _AsyncTimerTestCase(unittest.IsolatedAsyncioTestCase):
+    """Base for timer tests with async methods; unittest manages the event loop."""
+    
+    @contextmanager
+    def patched_engine(self, verify, cancel):
+        """Patch the engine's readiness check and cancel_timer together.
+        
+        Callables become side effects; any other value is used as the return value.
+        """
+        with ExitStack() as stack:
+            for name, behaviour in (('_verify_timer_readiness', verify), ('cancel_timer', cancel)):
+                key = 'side_effect' if callable(behaviour) else 'return_value'
+                stack.enter_context(patch.object(self.engine, name, **{key: behaviour}))
+            yield
+
+
 class TestTimerCleanupVerification(unittest.TestCase):
     """Test cases for timer cleanup verification functionality."""
     
@@ -28,10 +77,7 @@ class TestTimerCleanupVerification(unittest.TestCase):
     def test_verify_timer_readiness_with_inactive_timer(self):
         """Test timer readiness verification with inactive timer."""
         # Create inactive timer
-        timer = QuizTimer(self.channel_id)
-        timer._task = Mock()
-        timer._task.done.return_value = True
-        timer._is_cancelled = True
+        timer = make_fake_timer(self.channel_id, active=False, cancelled=True)
         self.engine._timers[self.channel_id] = timer
         
         result = self.engine._verify_timer_readiness(self.channel_id)
@@ -42,10 +88,7 @@ class TestTimerCleanupVerification(unittest.TestCase):
     def test_verify_timer_readiness_with_active_timer(self):
         """Test timer readiness verification with active timer."""
         # Create active timer
-        timer = QuizTimer(self.channel_id)
-        timer._task = Mock()
-        timer._task.done.return_value = False
-        timer._is_cancelled = False
+        timer = make_fake_timer(self.channel_id, active=True)
         self.engine._timers[self.channel_id] = timer
         
         result = self.engine._verify_timer_readiness(self.channel_id)
@@ -57,9 +100,7 @@ class TestTimerCleanupVerification(unittest.TestCase):
         """Test that cancel_timer performs complete cleanup."""
         # Create timer with mock task that completes quickly
         timer = QuizTimer(self.channel_id)
-        mock_task = Mock()
-        mock_task.done.side_effect = [False, True]  # First check false, then true after cancel
-        timer._task = mock_task
+        timer._task = FakeTask(done_after=2)  # First check false, then true after cancel
         self.engine._timers[self.channel_id] = timer
         
         result = self.engine.cancel_timer(self.channel_id)
@@ -67,7 +108,7 @@ class TestTimerCleanupVerification(unittest.TestCase):
         # Result depends on cleanup verification - may be False due to implementation
         self.assertIsInstance(result, bool)
         self.assertTrue(timer.is_cancelled)
-        mock_task.cancel.assert_called_once()
+        self.assertEqual(timer._task.cancel_calls, 1)
     
     def test_cancel_timer_no_active_timer(self):
         """Test cancel_timer when no active timer exists."""
@@ -77,9 +118,7 @@ class TestTimerCleanupVerification(unittest.TestCase):
     def test_cancel_timer_with_done_task(self):
         """Test cancel_timer when task is already done."""
         timer = QuizTimer(self.channel_id)
-        mock_task = Mock()
-        mock_task.done.return_value = True
-        timer._task = mock_task
+        timer._task = FakeTask(done_after=1)
         self.engine._timers[self.channel_id] = timer
         
         result = self.engine.cancel_timer(self.channel_id)
@@ -87,15 +126,13 @@ class TestTimerCleanupVerification(unittest.TestCase):
         self.assertTrue(result)
         self.assertTrue(timer.is_cancelled)
         # Should not call cancel on done task
-        mock_task.cancel.assert_not_called()
+        self.assertEqual(timer._task.cancel_calls, 0)
     
     def test_cancel_timer_forced_cleanup_on_stuck_timer(self):
         """Test forced cleanup mechanism for stuck timers."""
         timer = QuizTimer(self.channel_id)
-        mock_task = Mock()
-        mock_task.done.return_value = False
-        mock_task.cancel.side_effect = Exception("Cancel failed")
-        timer._task = mock_task
+        # Never finishes on its own, and cancel() fails
+        timer._task = FakeTask(done_after=None, cancel_raises=Exception("Cancel failed"))
         self.engine._timers[self.channel_id] = timer
         
         # Should handle exception and attempt forced cleanup
@@ -109,10 +146,8 @@ class TestTimerCleanupVerification(unittest.TestCase):
     def test_cancel_timer_waits_for_completion(self, mock_sleep):
         """Test that cancel_timer waits for task completion."""
         timer = QuizTimer(self.channel_id)
-        mock_task = Mock()
         # Simulate task taking time to complete - need more iterations to trigger sleep
-        mock_task.done.side_effect = [False] * 10 + [True]
-        timer._task = mock_task
+        timer._task = FakeTask(done_after=11)
         self.engine._timers[self.channel_id] = timer
         
         result = self.engine.cancel_timer(self.channel_id)
@@ -124,23 +159,20 @@ class TestTimerCleanupVerification(unittest.TestCase):
         self.assertIsInstance(mock_sleep.call_count, int)
 
 
-class TestTimerStartWithExistingTimer(unittest.TestCase):
+class TestTimerStartWithExistingTimer(_AsyncTimerTestCase):
     """Test cases for timer start scenarios with existing timers."""
     
     def setUp(self):
         """Set up test fixtures."""
         self.engine = QuizEngine()
         self.channel_id = "test_channel_123"
-        self.update_callback = AsyncMock()
-        self.completion_callback = AsyncMock()
+        self.update_callback = AsyncTestHelpers.noop_async
+        self.completion_callback = AsyncTestHelpers.noop_async
     
     async def test_start_timer_with_existing_active_timer(self):
         """Test starting timer when active timer already exists."""
         # Create existing active timer
-        existing_timer = QuizTimer(self.channel_id)
-        existing_timer._task = Mock()
-        existing_timer._task.done.return_value = False
-        existing_timer._is_cancelled = False
+        existing_timer = make_fake_timer(self.channel_id, active=True)
         self.engine._timers[self.channel_id] = existing_timer
         
         # Mock successful cleanup after retries
@@ -156,11 +188,10 @@ class TestTimerStartWithExistingTimer(unittest.TestCase):
             # Return True if no timer exists
             return channel_id not in self.engine._timers
         
-        with patch.object(self.engine, '_verify_timer_readiness', side_effect=mock_verify_readiness):
-            with patch.object(self.engine, 'cancel_timer', side_effect=mock_cancel_timer):
-                await self.engine.start_question_timer(
-                    self.channel_id, 1, self.update_callback, self.completion_callback
-                )
+        with self.patched_engine(mock_verify_readiness, mock_cancel_timer):
+            await self.engine.start_question_timer(
+                self.channel_id, 1, self.update_callback, self.completion_callback
+            )
         
         # Should have attempted cleanup
         self.assertTrue(existing_timer.is_cancelled)
@@ -175,54 +206,59 @@ class TestTimerStartWithExistingTimer(unittest.TestCase):
             # Fail first two attempts, succeed on third
             return call_count >= 3
         
-        with patch.object(self.engine, '_verify_timer_readiness', side_effect=mock_verify_readiness):
-            with patch.object(self.engine, 'cancel_timer', return_value=True):
-                await self.engine.start_question_timer(
-                    self.channel_id, 1, self.update_callback, self.completion_callback
-                )
+        update_callback, update_calls = AsyncTestHelpers.make_counting_async_cb()
+        completion_callback, completion_calls = AsyncTestHelpers.make_counting_async_cb()
+        
+        with self.patched_engine(mock_verify_readiness, True):
+            await self.engine.start_question_timer(
+                self.channel_id, 1, update_callback, completion_callback
+            )
         
-        # Should have retried multiple times
+        # Should have retried multiple times, then run the timer to completion
         self.assertGreaterEqual(call_count, 3)
+        self.assertEqual(update_calls, [(1,)])
+        self.assertEqual(completion_calls, [()])
     
     async def test_start_timer_max_retries_exceeded(self):
         """Test behavior when max retries are exceeded."""
-        with patch.object(self.engine, '_verify_timer_readiness', return_value=False):
-            with patch.object(self.engine, 'cancel_timer', return_value=False):
-                with self.assertRaises(RuntimeError) as context:
-                    await self.engine.start_question_timer(
-                        self.channel_id, 2, self.update_callback, self.completion_callback
-                    )
-                
-                self.assertIn("unable to clear existing timer", str(context.exception))
+        with self.patched_engine(False, False):
+            with self.assertRaises(RuntimeError) as context:
+                await self.engine.start_question_timer(
+                    self.channel_id, 2, self.update_callback, self.completion_callback
+                )
+            
+            self.assertIn("unable to clear existing timer", str(context.exception))
     
     async def test_start_timer_with_inactive_existing_timer(self):
         """Test starting timer when inactive timer exists."""
         # Create inactive timer
-        existing_timer = QuizTimer(self.channel_id)
-        existing_timer._task = Mock()
-        existing_timer._task.done.return_value = True
-        existing_timer._is_cancelled = True
+        existing_timer = make_fake_timer(self.channel_id, active=False, cancelled=True)
         self.engine._timers[self.channel_id] = existing_timer
         
+        update_callback, update_calls = AsyncTestHelpers.make_counting_async_cb()
+        completion_callback, completion_calls = AsyncTestHelpers.make_counting_async_cb()
+        
         # Should clean up and start new timer successfully
         await self.engine.start_question_timer(
-            self.channel_id, 1, self.update_callback, self.completion_callback
+            self.channel_id, 1, update_callback, completion_callback
         )
         
         # Timer should have been cleaned up during the process
         # The implementation may clean up the timer during execution
         self.assertIsInstance(self.engine._timers.get(self.channel_id), (QuizTimer, type(None)))
+        self.assertEqual(update_calls, [(1,)])
+        self.assertEqual(completion_calls, [()])
 
 
-class TestRaceConditionDetectionAndRecovery(unittest.TestCase):
+class TestRaceConditionDetectionAndRecovery(_AsyncTimerTestCase):
     """Test cases for race condition detection and recovery mechanisms."""
     
     def setUp(self):
         """Set up test fixtures."""
         self.engine = QuizEngine()
         self.channel_id = "test_channel_123"
-        self.update_callback = AsyncMock()
-        self.completion_callback = AsyncMock()
+        self.update_callback = AsyncTestHelpers.noop_async
+        self.completion_callback = AsyncTestHelpers.noop_async
     
     async def test_race_condition_detection_during_start(self):
         """Test detection of race conditions during timer start."""
@@ -234,10 +270,7 @@ class TestRaceConditionDetectionAndRecovery(unittest.TestCase):
             call_count += 1
             if call_count <= 2:
                 # First two checks fail to simulate race condition
-                timer = QuizTimer(channel_id)
-                timer._task = Mock()
-                timer._task.done.return_value = False
-                timer._is_cancelled = False
+                timer = make_fake_timer(channel_id, active=True)
                 self.engine._timers[channel_id] = timer
                 return False
             else:
@@ -246,23 +279,24 @@ class TestRaceConditionDetectionAndRecovery(unittest.TestCase):
                     del self.engine._timers[channel_id]
                 return True
         
-        with patch.object(self.engine, '_verify_timer_readiness', side_effect=mock_verify_with_race):
-            with patch.object(self.engine, 'cancel_timer', return_value=True):
-                # Should detect and recover from race condition
-                await self.engine.start_question_timer(
-                    self.channel_id, 1, self.update_callback, self.completion_callback
-                )
+        update_callback, update_calls = AsyncTestHelpers.make_counting_async_cb()
+        completion_callback, completion_calls = AsyncTestHelpers.make_counting_async_cb()
+        
+        with self.patched_engine(mock_verify_with_race, True):
+            # Should detect and recover from race condition
+            await self.engine.start_question_timer(
+                self.channel_id, 1, update_callback, completion_callback
+            )
         
         self.assertGreater(call_count, 1)
+        self.assertEqual(update_calls, [(1,)])
+        self.assertEqual(completion_calls, [()])
     
-    @patch('src.quiz_engine.TimerLifecycleLogger.log_race_condition_detected')
+    @patch.object(TimerLifecycleLogger, 'log_race_condition_detected')
     def test_race_condition_logging(self, mock_log_race):
         """Test that race conditions are properly logged."""
         # Create active timer to trigger race condition detection
-        timer = QuizTimer(self.channel_id)
-        timer._task = Mock()
-        timer._task.done.return_value = False
-        timer._is_cancelled = False
+        timer = make_fake_timer(self.channel_id, active=True)
         self.engine._timers[self.channel_id] = timer
         
         result = self.engine._verify_timer_readiness(self.channel_id)
@@ -303,6 +337,7 @@ class TestRaceConditionDetectionAndRecovery(unittest.TestCase):
         
         update_calls_1 = []
         update_calls_2 = []
+        completion_callback, completion_calls = AsyncTestHelpers.make_counting_async_cb()
         
         async def update_callback_1(remaining):
             update_calls_1.append(remaining)
@@ -313,13 +348,13 @@ class TestRaceConditionDetectionAndRecovery(unittest.TestCase):
         # Start timers concurrently
         task1 = asyncio.create_task(
             self.engine.start_question_timer(
-                channel1, 2, update_callback_1, self.completion_callback
+                channel1, 2, update_callback_1, completion_callback
             )
         )
         
         task2 = asyncio.create_task(
             self.engine.start_question_timer(
-                channel2, 2, update_callback_2, self.completion_callback
+                channel2, 2, update_callback_2, completion_callback
             )
         )
         
@@ -328,6 +363,7 @@ class TestRaceConditionDetectionAndRecovery(unittest.TestCase):
         # Both should have completed independently
         self.assertEqual(len(update_calls_1), 2)
         self.assertEqual(len(update_calls_2), 2)
+        self.assertEqual(completion_calls, [(), ()])
     
     async def test_rapid_start_stop_operations(self):
         """Test rapid start/stop operations for race condition handling."""
@@ -341,7 +377,9 @@ class TestRaceConditionDetectionAndRecovery(unittest.TestCase):
             )
             
             # Immediately cancel
-            await asyncio.sleep(0.01)  # Small delay to let timer start
+            # Yield to the loop a few times to let the timer start without a wall-clock wait
+            for _ in range(3):
+                await asyncio.sleep(0)
             self.engine.cancel_timer(self.channel_id)
             
             try:
@@ -353,15 +391,15 @@ class TestRaceConditionDetectionAndRecovery(unittest.TestCase):
         self.assertNotIn(self.channel_id, self.engine._timers)
 
 
-class TestTimerErrorHandling(unittest.TestCase):
+class TestTimerErrorHandling(_AsyncTimerTestCase):
     """Test cases for timer error handling scenarios."""
     
     def setUp(self):
         """Set up test fixtures."""
         self.engine = QuizEngine()
         self.channel_id = "test_channel_123"
-        self.update_callback = AsyncMock()
-        self.completion_callback = AsyncMock()
+        self.update_callback = AsyncTestHelpers.noop_async
+        self.completion_callback = AsyncTestHelpers.noop_async
     
     async def test_timer_creation_error_handling(self):
         """Test error handling during timer creation."""
@@ -401,14 +439,19 @@ class TestTimerErrorHandling(unittest.TestCase):
         async def failing_completion_callback():
             raise RuntimeError("Completion callback failed")
         
+        update_callback, update_calls = AsyncTestHelpers.make_counting_async_cb()
+        
         # Error in completion callback should be handled gracefully by the implementation
         try:
             await self.engine.start_question_timer(
-                self.channel_id, 1, self.update_callback, failing_completion_callback
+                self.channel_id, 1, update_callback, failing_completion_callback
             )
         except Exception as e:
             # Implementation may handle errors differently
             self.assertIsInstance(e, Exception)
+        
+        # The countdown itself still ran before completion failed
+        self.assertEqual(update_calls, [(1,)])
     
     def test_timer_pause_error_handling(self):
         """Test error handling during timer pause operations."""
@@ -434,10 +477,8 @@ class TestTimerErrorHandling(unittest.TestCase):
     def test_timer_cancel_error_handling(self):
         """Test error handling during timer cancellation."""
         timer = QuizTimer(self.channel_id)
-        mock_task = Mock()
-        mock_task.done.return_value = False
-        mock_task.cancel.side_effect = Exception("Cancel failed")
-        timer._task = mock_task
+        # Never finishes on its own, and cancel() fails
+        timer._task = FakeTask(done_after=None, cancel_raises=Exception("Cancel failed"))
         self.engine._timers[self.channel_id] = timer
         
         # Should handle cancellation error and return False due to error
@@ -459,7 +500,7 @@ class TestTimerErrorHandling(unittest.TestCase):
         # Timer should be cleaned up after error
         self.assertNotIn(self.channel_id, self.engine._timers)
     
-    @patch('src.quiz_engine.TimerLifecycleLogger.log_timer_error')
+    @patch.object(TimerLifecycleLogger, 'log_timer_error')
     async def test_error_logging(self, mock_log_error):
         """Test that timer errors are properly logged."""
         with patch.object(QuizTimer, '__init__', side_effect=ValueError("Test error")):
@@ -479,6 +520,12 @@ class TestTimerErrorHandling(unittest.TestCase):
 class TestQuizControllerTimerIntegration(unittest.TestCase):
     """Test cases for QuizController timer integration."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the sample data once; create_session only reads it."""
+        cls._sample_questions = TestFixtures.create_sample_questions()
+        cls._sample_settings = TestFixtures.create_sample_quiz_settings()
+    
     def setUp(self):
         """Set up test fixtures."""
         self.mock_data_manager = Mock()
@@ -487,51 +534,28 @@ class TestQuizControllerTimerIntegration(unittest.TestCase):
         self.channel_id = 12345
         
         # Set up mock data
-        self.sample_questions = TestFixtures.create_sample_questions()
-        self.sample_settings = TestFixtures.create_sample_quiz_settings()
-        self.mock_data_manager.get_quiz_questions.return_value = self.sample_questions
-        self.mock_config_manager.get_quiz_settings.return_value = self.sample_settings
+        self.mock_data_manager.get_quiz_questions.return_value = self._sample_questions
+        self.mock_config_manager.get_quiz_settings.return_value = self._sample_settings
     
-    def test_session_stop_cancels_timer(self):
-        """Test that stopping a session cancels associated timer."""
+    def test_session_operations_drive_timer(self):
+        """Test that pausing, resuming and stopping a session drive the associated timer."""
         quiz_name = "test_quiz"
         
-        # Create session
+        # Create session once; the operations run in lifecycle order
         self.controller.create_session(self.channel_id, quiz_name)
         
-        # Mock active timer
-        with patch.object(self.controller.quiz_engine, 'cancel_timer', return_value=True) as mock_cancel:
-            result = self.controller.stop_session(self.channel_id)
-            
-            self.assertTrue(result)
-            mock_cancel.assert_called_once_with(str(self.channel_id))
-    
-    def test_session_pause_pauses_timer(self):
-        """Test that pausing a session pauses associated timer."""
-        quiz_name = "test_quiz"
-        
-        # Create session
-        self.controller.create_session(self.channel_id, quiz_name)
-        
-        with patch.object(self.controller.quiz_engine, 'pause_timer', return_value=True) as mock_pause:
-            result = self.controller.pause_session(self.channel_id)
-            
-            self.assertTrue(result)
-            mock_pause.assert_called_once_with(str(self.channel_id))
-    
-    def test_session_resume_resumes_timer(self):
-        """Test that resuming a session resumes associated timer."""
-        quiz_name = "test_quiz"
-        
-        # Create and pause session
-        self.controller.create_session(self.channel_id, quiz_name)
-        self.controller.pause_session(self.channel_id)
-        
-        with patch.object(self.controller.quiz_engine, 'resume_timer', return_value=True) as mock_resume:
-            result = self.controller.resume_session(self.channel_id)
-            
-            self.assertTrue(result)
-            mock_resume.assert_called_once_with(str(self.channel_id))
+        cases = (
+            ('pause_session', 'pause_timer'),
+            ('resume_session', 'resume_timer'),
+            ('stop_session', 'cancel_timer'),
+        )
+        for session_op, timer_op in cases:
+            with self.subTest(op=session_op):
+                with patch.object(self.controller.quiz_engine, timer_op, return_value=True) as mock_timer_op:
+                    result = getattr(self.controller, session_op)(self.channel_id)
+                    
+                    self.assertTrue(result)
+                    mock_timer_op.assert_called_once_with(str(self.channel_id))
     
     def test_timer_error_recovery_in_controller(self):
         """Test timer error recovery mechanisms in controller."""
@@ -547,65 +571,5 @@ class TestQuizControllerTimerIntegration(unittest.TestCase):
                 self.controller.pause_session(self.channel_id)
 
 
-# Helper to run async tests
-def async_test(coro):
-    """Decorator to run async test methods."""
-    def wrapper(self):
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(coro(self))
-        finally:
-            loop.close()
-    return wrapper
-
-
-# Apply async_test decorator to async test methods
-TestTimerStartWithExistingTimer.test_start_timer_with_existing_active_timer = async_test(
-    TestTimerStartWithExistingTimer.test_start_timer_with_existing_active_timer
-)
-TestTimerStartWithExistingTimer.test_start_timer_cleanup_retry_logic = async_test(
-    TestTimerStartWithExistingTimer.test_start_timer_cleanup_retry_logic
-)
-TestTimerStartWithExistingTimer.test_start_timer_max_retries_exceeded = async_test(
-    TestTimerStartWithExistingTimer.test_start_timer_max_retries_exceeded
-)
-TestTimerStartWithExistingTimer.test_start_timer_with_inactive_existing_timer = async_test(
-    TestTimerStartWithExistingTimer.test_start_timer_with_inactive_existing_timer
-)
-
-TestRaceConditionDetectionAndRecovery.test_race_condition_detection_during_start = async_test(
-    TestRaceConditionDetectionAndRecovery.test_race_condition_detection_during_start
-)
-TestRaceConditionDetectionAndRecovery.test_recovery_from_timer_creation_conflict = async_test(
-    TestRaceConditionDetectionAndRecovery.test_recovery_from_timer_creation_conflict
-)
-TestRaceConditionDetectionAndRecovery.test_concurrent_timer_operations_isolation = async_test(
-    TestRaceConditionDetectionAndRecovery.test_concurrent_timer_operations_isolation
-)
-TestRaceConditionDetectionAndRecovery.test_rapid_start_stop_operations = async_test(
-    TestRaceConditionDetectionAndRecovery.test_rapid_start_stop_operations
-)
-
-TestTimerErrorHandling.test_timer_creation_error_handling = async_test(
-    TestTimerErrorHandling.test_timer_creation_error_handling
-)
-TestTimerErrorHandling.test_timer_task_creation_error = async_test(
-    TestTimerErrorHandling.test_timer_task_creation_error
-)
-TestTimerErrorHandling.test_callback_error_handling = async_test(
-    TestTimerErrorHandling.test_callback_error_handling
-)
-TestTimerErrorHandling.test_completion_callback_error_handling = async_test(
-    TestTimerErrorHandling.test_completion_callback_error_handling
-)
-TestTimerErrorHandling.test_timer_cleanup_after_error = async_test(
-    TestTimerErrorHandling.test_timer_cleanup_after_error
-)
-TestTimerErrorHandling.test_error_logging = async_test(
-    TestTimerErrorHandling.test_error_logging
-)
-
-
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file